@@ -5,10 +5,13 @@ import json
 import os
 import random
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 @dataclass
@@ -53,31 +56,41 @@ class AssetAppraisalAgent:
     # Public API
     # ------------------------------------------------------------------
     def evaluate(self, asset_type: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        slug = _slugify(asset_type)
-        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-        asset_id = f"valuation_{slug}_{timestamp}"
-
-        declared_value = self._safe_float(metadata.get("declared_value"))
-        base_value = declared_value if declared_value else random.uniform(75_000, 950_000)
-        market_factor = random.uniform(0.9, 1.1)
-        risk_factor = random.uniform(0.85, 1.15)
-        estimated_value = base_value * market_factor * risk_factor
-
-        result = {
-            "asset_id": asset_id,
-            "asset_type": asset_type,
-            "metadata": metadata or {},
-            "estimated_value": round(estimated_value, 2),
-            "confidence": round(random.uniform(0.82, 0.97), 2),
-            "model_name": self.model_name,
-            "timestamp": datetime.utcnow().isoformat(),
-            "source": "valuation",
-        }
-
-        output_path = self.valuations_dir / f"{asset_id}.json"
-        self._write_json(output_path, result)
+        result = self._build_valuation(asset_type, metadata)
+        self._write_json(self.valuations_dir / f"{result['asset_id']}.json", result)
         return result
 
+    def evaluate_many(
+        self,
+        items: Sequence[Tuple[str, Dict[str, Any]]],
+        max_workers: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Value a batch of ``(asset_type, metadata)`` pairs.
+
+        Valuations are computed in order from random factors drawn up front in
+        one vectorized call; persisting the per-asset JSON files (the IO-bound
+        part) is fanned out over a thread pool. Results keep the input order.
+        """
+        n = len(items)
+        rng = np.random.default_rng()
+        draws = np.column_stack((
+            rng.uniform(75_000, 950_000, n),
+            rng.uniform(0.9, 1.1, n),
+            rng.uniform(0.85, 1.15, n),
+            rng.uniform(0.82, 0.97, n),
+        )).tolist()
+        results = [
+            self._build_valuation(asset_type, metadata, seq=idx, draws=draws[idx])
+            for idx, (asset_type, metadata) in enumerate(items)
+        ]
+        if results:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(results)))) as pool:
+                list(pool.map(
+                    lambda r: self._write_json(self.valuations_dir / f"{r['asset_id']}.json", r),
+                    results,
+                ))
+        return results
+
     def apply_verification(
         self,
         asset_id: str,
@@ -191,6 +204,43 @@ class AssetAppraisalAgent:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _build_valuation(
+        self,
+        asset_type: str,
+        metadata: Dict[str, Any],
+        seq: Optional[int] = None,
+        draws: Optional[Sequence[float]] = None,
+    ) -> Dict[str, Any]:
+        slug = _slugify(asset_type)
+        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        # batch items share a timestamp; the sequence number keeps ids (and files) unique
+        asset_id = f"valuation_{slug}_{timestamp}" if seq is None else f"valuation_{slug}_{timestamp}_{seq:04d}"
+
+        # draws = (fallback base value, market factor, risk factor, confidence)
+        if draws is None:
+            draws = (
+                random.uniform(75_000, 950_000),
+                random.uniform(0.9, 1.1),
+                random.uniform(0.85, 1.15),
+                random.uniform(0.82, 0.97),
+            )
+        fallback_value, market_factor, risk_factor, confidence = draws
+
+        declared_value = self._safe_float(metadata.get("declared_value"))
+        base_value = declared_value if declared_value else fallback_value
+        estimated_value = base_value * market_factor * risk_factor
+
+        return {
+            "asset_id": asset_id,
+            "asset_type": asset_type,
+            "metadata": metadata or {},
+            "estimated_value": round(estimated_value, 2),
+            "confidence": round(confidence, 2),
+            "model_name": self.model_name,
+            "timestamp": datetime.utcnow().isoformat(),
+            "source": "valuation",
+        }
+
     def _write_json(self, path: Path, payload: Dict[str, Any]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w", encoding="utf-8") as handle:
@@ -18,6 +18,9 @@ try:  # pragma: no cover - optional dependency during bootstrapping
 except Exception:  # pragma: no cover - fallback when asset agent is absent
     AssetAppraisalAgent = None  # type: ignore
 
+# json.dumps only reuses its cached encoder for default arguments; keep one for ensure_ascii=False
+_encode_json_utf8 = json.JSONEncoder(ensure_ascii=False).encode
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Paths / Runs root
@@ -52,17 +55,45 @@ def _mk_run_dir(run_id: str) -> str:
 # Asset integration helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
+# (newest valuation file, newest verified file) -> latest asset record
+_ASSET_CONTEXT_CACHE: Dict[str, Any] = {"key": None, "record": None}
+
+
+def _newest_json(directory) -> Tuple[str, int] | None:
+    """(name, st_mtime_ns) of the most recently modified *.json entry in directory."""
+    newest = None
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    stamp = (entry.stat().st_mtime_ns, entry.name)
+                    if newest is None or stamp > newest:
+                        newest = stamp
+    except FileNotFoundError:
+        return None
+    return (newest[1], newest[0]) if newest else None
+
+
 def _load_asset_context() -> Dict[str, Any] | None:
     if AssetAppraisalAgent is None:
         return None
     try:
         agent = AssetAppraisalAgent()
-        return agent.get_latest_asset_record()
+        # Key on the newest file in each directory, not the directory mtime: ids only
+        # have one-second resolution, so a rerun can overwrite an existing file in place.
+        key = (_newest_json(agent.valuations_dir), _newest_json(agent.verified_dir))
+        if _ASSET_CONTEXT_CACHE["key"] != key:
+            _ASSET_CONTEXT_CACHE["record"] = agent.get_latest_asset_record()
+            _ASSET_CONTEXT_CACHE["key"] = key
+        record = _ASSET_CONTEXT_CACHE["record"]
+        return dict(record) if record else record
     except Exception:
         return None
 
 
-def _extract_loan_amount(row: pd.Series) -> float:
+def _extract_loan_amounts(df: pd.DataFrame) -> np.ndarray:
+    """Per row, the first positive amount among the known loan-amount columns (else 0.0)."""
+    amounts = np.zeros(len(df), dtype=float)
     for key in (
         "requested_amount",
         "loan_amount",
@@ -70,12 +101,12 @@ def _extract_loan_amount(row: pd.Series) -> float:
         "loan_amt",
         "amount_requested",
     ):
-        value = row.get(key)
-        if value not in (None, ""):
-            parsed = _safe_float(value, 0.0)
-            if parsed and parsed > 0:
-                return float(parsed)
-    return 0.0
+        if key not in df.columns:
+            continue
+        values = pd.to_numeric(df[key], errors="coerce").to_numpy(dtype=float)
+        take = (amounts == 0.0) & (values > 0)
+        amounts[take] = values[take]
+    return amounts
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -257,7 +288,9 @@ def _run_core(df_in: pd.DataFrame, **params) -> Dict[str, Any]:
     if df_in is None or df_in.empty:
         raise ValueError("Empty input dataframe.")
 
-    df = df_in.copy()
+    # Shallow copy: every write below assigns whole columns, so the caller's frame
+    # is never mutated and the input data blocks are shared rather than duplicated.
+    df = df_in.copy(deep=False)
 
     # — Model selection from UI/API params
     selected_model_name = params.get("selected_model_name") or None
@@ -284,7 +317,7 @@ def _run_core(df_in: pd.DataFrame, **params) -> Dict[str, Any]:
         probs = (preds.astype(float) + 0.1) / 1.2
     probs = np.clip(probs, 0.0, 1.0)
     df["score"] = probs
-    df["base_score"] = df["score"]
+    df["base_score"] = probs
 
     # Asset context integration (collateral influence)
     asset_context = _load_asset_context() or {}
@@ -298,45 +331,35 @@ def _run_core(df_in: pd.DataFrame, **params) -> Dict[str, Any]:
     target_ltv = _as_float(params, "target_ltv", 0.8)
 
     index_list = list(df.index)
-    adjustment_factors: List[float] = []
-    ltv_values: List[float | None] = []
 
     if asset_value > 0:
-        for idx in index_list:
-            row = df.loc[idx]
-            base_score = _safe_float(row.get("base_score"), 0.0)
-            loan_amount = _extract_loan_amount(row)
-            if loan_amount > 0:
-                ltv = loan_amount / asset_value
-                ltv_values.append(round(ltv, 4))
-                if ltv <= target_ltv:
-                    coverage_factor = min(1.15, 1.0 + (target_ltv - ltv) * 0.1)
-                else:
-                    coverage_factor = max(0.8, 1.0 - (ltv - target_ltv) * 0.2)
-            else:
-                ltv = None
-                ltv_values.append(None)
-                coverage_factor = 1.0
-
-            if asset_legitimacy:
-                legitimacy_delta = max(-0.05, min(0.05, (asset_legitimacy - 0.9) * 0.1))
-                legitimacy_factor = 1.0 + legitimacy_delta
-            else:
-                legitimacy_factor = 1.0
-
-            if asset_confidence:
-                confidence_delta = max(-0.05, min(0.05, (asset_confidence - 0.85) * 0.1))
-                confidence_factor = 1.0 + confidence_delta
-            else:
-                confidence_factor = 1.0
-
-            verification_factor = 1.03 if asset_verified else 0.98
-            factor = coverage_factor * legitimacy_factor * confidence_factor * verification_factor
-            factor = max(0.75, min(factor, 1.2))
-            adjustment_factors.append(round(factor, 4))
-
-            adjusted_score = float(np.clip((base_score or 0.0) * factor, 0.0, 1.0))
-            df.at[idx, "score"] = adjusted_score
+        loan_amounts = _extract_loan_amounts(df)
+        has_loan = loan_amounts > 0
+        ltv = loan_amounts / asset_value
+        coverage_factor = np.where(
+            ltv <= target_ltv,
+            np.minimum(1.15, 1.0 + (target_ltv - ltv) * 0.1),
+            np.maximum(0.8, 1.0 - (ltv - target_ltv) * 0.2),
+        )
+        coverage_factor = np.where(has_loan, coverage_factor, 1.0)
+
+        if asset_legitimacy:
+            legitimacy_factor = 1.0 + max(-0.05, min(0.05, (asset_legitimacy - 0.9) * 0.1))
+        else:
+            legitimacy_factor = 1.0
+
+        if asset_confidence:
+            confidence_factor = 1.0 + max(-0.05, min(0.05, (asset_confidence - 0.85) * 0.1))
+        else:
+            confidence_factor = 1.0
+
+        verification_factor = 1.03 if asset_verified else 0.98
+        factor = np.clip(coverage_factor * legitimacy_factor * confidence_factor * verification_factor, 0.75, 1.2)
+
+        ltv_values = np.where(has_loan, np.round(ltv, 4), np.nan)
+        adjustment_factors = np.round(factor, 4)
+        base_scores = df["base_score"].to_numpy(dtype=float)
+        df["score"] = np.clip(np.nan_to_num(base_scores) * factor, 0.0, 1.0)
     else:
         ltv_values = [None for _ in index_list]
         adjustment_factors = [1.0 for _ in index_list]
@@ -387,8 +410,15 @@ def _run_core(df_in: pd.DataFrame, **params) -> Dict[str, Any]:
     proposals: List[Dict[str, Any]] = []
     top_feature = "score"
 
-    for idx in index_list:
-        row = df.loc[idx]
+    # plain dicts: the rules only .get() fields, and this avoids a Series per row.
+    # to_dict() turns numpy bools into Python bools, which would change the
+    # `include_flag is False` check below; read that flag as df.loc[idx] did.
+    include_flags = (
+        df["asset_include_in_credit"].to_numpy()
+        if "asset_include_in_credit" in df.columns
+        else [None] * len(df)
+    )
+    for row, include_flag in zip(df.to_dict(orient="records"), include_flags):
         model_pass = _safe_float(row.get("score"), 0.0) >= float(threshold)
         row_reasons = {"model_threshold": model_pass}
 
@@ -408,7 +438,6 @@ def _run_core(df_in: pd.DataFrame, **params) -> Dict[str, Any]:
             elif override == "pending_asset_review" and final_decision == "approved":
                 final_decision = "pending_asset_review"
 
-        include_flag = row.get("asset_include_in_credit")
         if include_flag is False and final_decision == "approved":
             final_decision = "pending_asset_review"
 
@@ -417,7 +446,7 @@ def _run_core(df_in: pd.DataFrame, **params) -> Dict[str, Any]:
         proposals.append(prop)
 
     df["decision"] = decisions
-    df["rule_reasons"] = [json.dumps(r, ensure_ascii=False) for r in reasons]
+    df["rule_reasons"] = [_encode_json_utf8(r) for r in reasons]
     df["top_feature"] = top_feature
 
     # Flatten proposal columns
@@ -499,7 +528,10 @@ def _run_core(df_in: pd.DataFrame, **params) -> Dict[str, Any]:
         "asset_adjustment_factor",
     ]
     available_cols = [col for col in explanation_columns if col in df.columns]
-    explanations = df[available_cols].to_dict(orient="records")
+    # Missing values as None (the JSON response encoder rejects NaN); values otherwise keep
+    # full precision and their own types, e.g. datetimes stay Timestamps.
+    expl_df = df[available_cols]
+    explanations = expl_df.astype(object).where(expl_df.notna(), None).to_dict(orient="records")
 
     # NOTE: return JSON-serializable only (no DataFrame) to avoid FastAPI serialization errors.
     return {
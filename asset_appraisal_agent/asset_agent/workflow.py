@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import json
 import random
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import dataclass, asdict, fields
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Sequence
 
@@ -54,6 +54,9 @@ class AssetAppraisalResult:
         return data
 
 
+_RESULT_FIELDS = tuple(f.name for f in fields(AssetAppraisalResult))
+
+
 def generate_synthetic_loans(
     n_loans: int = 80,
     collateral_ratio: float = 0.8,
@@ -62,29 +65,27 @@ def generate_synthetic_loans(
     """Generate a synthetic set of loan requests with collateral hints."""
 
     rng = np.random.default_rng(seed)
-    loan_ids = [f"APP-{1000 + i}" for i in range(n_loans)]
+    loan_ids = np.char.add("APP-", np.arange(1000, 1000 + n_loans).astype(str)).astype(object)
     loan_amounts = rng.integers(20_000, 350_000, size=n_loans)
     income = rng.integers(30_000, 180_000, size=n_loans)
     collateral_flags = rng.uniform(0, 1, size=n_loans) < collateral_ratio
-
-    rows = []
-    for idx, loan_id in enumerate(loan_ids):
-        has_collateral = bool(collateral_flags[idx])
-        base_amount = float(loan_amounts[idx])
-        asset_type = random.choice(_ASSET_TYPES)
-        declared_value = base_amount * random.uniform(0.9, 1.6) if has_collateral else 0.0
-        rows.append(
-            {
-                "application_id": loan_id,
-                "loan_amount": base_amount,
-                "income": float(income[idx]),
-                "customer_segment": random.choice(["Retail", "SME", "Corporate"]),
-                "has_collateral": has_collateral,
-                "declared_collateral_value": round(declared_value, 2),
-                "asset_type_hint": asset_type if has_collateral else None,
-            }
-        )
-    return pd.DataFrame(rows)
+    asset_types = rng.choice(np.array(_ASSET_TYPES, dtype=object), size=n_loans)
+    value_multipliers = rng.uniform(0.9, 1.6, size=n_loans)
+    segments = rng.choice(np.array(["Retail", "SME", "Corporate"], dtype=object), size=n_loans)
+
+    base_amounts = loan_amounts.astype(float)
+    declared_values = np.where(collateral_flags, base_amounts * value_multipliers, 0.0).round(2)
+    return pd.DataFrame(
+        {
+            "application_id": loan_ids,
+            "loan_amount": base_amounts,
+            "income": income.astype(float),
+            "customer_segment": segments,
+            "has_collateral": collateral_flags,
+            "declared_collateral_value": declared_values,
+            "asset_type_hint": np.where(collateral_flags, asset_types, None),
+        }
+    )
 
 
 class AssetAppraisalWorkflow:
@@ -106,8 +107,13 @@ class AssetAppraisalWorkflow:
         if df.empty:
             raise ValueError("No loan records supplied to asset appraisal workflow.")
 
-        results = [self._evaluate_row(row) for row in df.to_dict(orient="records")]
-        return pd.DataFrame([result.to_record() for result in results])
+        # One timestamp per batch: every row in a run shares the run's check time.
+        checked_at = datetime.now(timezone.utc).isoformat()
+        results = [self._evaluate_row(row, checked_at) for row in df.to_dict(orient="records")]
+        # Column-wise assembly: one list per field instead of a dict per row.
+        columns = {name: [getattr(result, name) for result in results] for name in _RESULT_FIELDS}
+        columns["workflow_trace"] = [json.dumps(trace, ensure_ascii=False) for trace in columns["workflow_trace"]]
+        return pd.DataFrame(columns, columns=list(_RESULT_FIELDS))
 
     def generate_synthetic(self, n_loans: int = 80, collateral_ratio: float = 0.8) -> pd.DataFrame:
         loans = generate_synthetic_loans(n_loans=n_loans, collateral_ratio=collateral_ratio, seed=self.random.randint(0, 9999))
@@ -122,7 +128,7 @@ class AssetAppraisalWorkflow:
     # ------------------------------------------------------------------
     # Internal logic
     # ------------------------------------------------------------------
-    def _evaluate_row(self, row: Dict[str, Any]) -> AssetAppraisalResult:
+    def _evaluate_row(self, row: Dict[str, Any], checked_at: str) -> AssetAppraisalResult:
         app_id = self._resolve_application_id(row)
         loan_amount = float(self._safe_float(row.get("loan_amount") or row.get("requested_amount"), default=0.0))
         declared_value = float(self._safe_float(row.get("declared_collateral_value"), default=loan_amount * self.random.uniform(0.85, 1.5)))
@@ -169,7 +175,7 @@ class AssetAppraisalWorkflow:
             legitimacy_score=legitimacy,
             include_in_credit=include_in_credit,
             notes="; ".join(notes) if notes else "",
-            last_updated=datetime.utcnow().isoformat(),
+            last_updated=checked_at,
             workflow_trace=workflow_trace,
             loan_amount_declared=round(loan_amount, 2) if loan_amount else None,
             borrower_segment=row.get("customer_segment"),
@@ -2,16 +2,41 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
 
 from agents.asset_appraisal import AssetAppraisalAgent
 
 router = APIRouter(prefix="/v1/agents/asset_appraisal", tags=["asset_appraisal"])
 
 
+class AssetItem(BaseModel):
+    asset_type: str
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+# Each item writes one valuation file, so a single request can't fan out unbounded writes.
+MAX_BATCH_ITEMS = 500
+
+
+class AssetBatchRequest(BaseModel):
+    items: List[AssetItem] = Field(
+        ...,
+        max_length=MAX_BATCH_ITEMS,
+        description="Assets to value, results are returned in the same order",
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_agent() -> AssetAppraisalAgent:
+    """Process-wide agent; it only holds resolved directory paths, so one instance serves every request."""
+    return AssetAppraisalAgent()
+
+
 def _parse_bool(value: Any) -> bool:
     if isinstance(value, bool):
         return value
@@ -30,13 +55,24 @@ def run_asset_appraisal(asset_type: str = Form(...), metadata: str = Form("{}"))
         raise HTTPException(status_code=400, detail=f"Invalid metadata JSON: {exc}") from exc
 
     try:
-        agent = AssetAppraisalAgent()
+        agent = _get_agent()
         result = agent.evaluate(asset_type, parsed_meta)
         return {"status": "ok", "result": result}
     except Exception as exc:  # pragma: no cover - defensive
         raise HTTPException(status_code=500, detail=f"Asset appraisal failed: {exc}") from exc
 
 
+@router.post("/run_batch")
+def run_asset_appraisal_batch(req: AssetBatchRequest) -> Dict[str, Any]:
+    """Value many assets in one request instead of one /run call per asset."""
+    try:
+        agent = _get_agent()
+        results = agent.evaluate_many([(item.asset_type, item.metadata) for item in req.items])
+        return {"status": "ok", "count": len(results), "results": results}
+    except Exception as exc:  # pragma: no cover - defensive
+        raise HTTPException(status_code=500, detail=f"Asset appraisal batch failed: {exc}") from exc
+
+
 @router.post("/verify")
 def verify_asset_legitimacy(
     asset_id: str = Form(...),
@@ -45,7 +81,7 @@ def verify_asset_legitimacy(
     inspector_notes: str = Form(""),
     local_authority_ref: str = Form(""),
 ) -> Dict[str, Any]:
-    agent = AssetAppraisalAgent()
+    agent = _get_agent()
     try:
         updated = agent.apply_verification(
             asset_id=asset_id,
@@ -70,7 +106,7 @@ def upload_field_data(
     notes: str = Form(""),
     photo: UploadFile | None = File(default=None),
 ) -> JSONResponse:
-    agent = AssetAppraisalAgent()
+    agent = _get_agent()
     photo_bytes: Optional[bytes] = None
     photo_name: Optional[str] = None
 
@@ -101,7 +101,8 @@ async def get_bridge_meta(bridge_id: str) -> JSONResponse:
         meta.update(stored)
 
     if meta.get("rows", 0) == 0:
-        df = pd.read_csv(csv_path)
+        # only shape/header are needed here, so the multithreaded arrow reader is safe to use
+        df = pd.read_csv(csv_path, engine="pyarrow")
         meta["rows"] = int(df.shape[0])
         meta["columns"] = list(map(str, df.columns))
     return JSONResponse({"status": "ok", **meta})
@@ -42,8 +42,19 @@ def build_training_frame(base_csvs: list[str], cutoff_date: str | None) -> tuple
         fb = fb.sort_values("timestamp_utc").drop_duplicates("application_id", keep="last")
 
     feat_cols_fb = [c for c in fb.columns if c.startswith("feature_")]
-    cols_for_merge = ["application_id","y_true"] + feat_cols_fb if "y_true" in fb.columns else ["application_id"] + feat_cols_fb
-    merged = base.merge(fb[cols_for_merge] if not fb.empty else base[["application_id"]], on="application_id", how="left")
+    cols_for_merge = ["y_true"] + feat_cols_fb if "y_true" in fb.columns else feat_cols_fb
+    # feedback keyed by application_id -> direct key lookups instead of a join;
+    # feedback wins where present, rows without feedback keep the base value
+    if fb.empty:
+        merged = base
+    else:
+        fb_idx = fb.set_index("application_id")
+        fb_idx = fb_idx[~fb_idx.index.duplicated(keep="last")]  # map() needs a unique index
+        ids = base["application_id"]
+        merged = base.assign(**{
+            c: ids.map(fb_idx[c]).combine_first(base[c]) if c in base.columns else ids.map(fb_idx[c])
+            for c in cols_for_merge
+        })
 
     # apply corrected features where present
     for c in feat_cols_fb:
@@ -7,32 +7,41 @@ import os
 import re
 import io
 import json
+import base64
+import hashlib
+import mimetypes
+import shutil
 import datetime
-from typing import Optional, Dict, List, Any
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, NamedTuple
 
 import pandas as pd
 import numpy as np
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import plotly.express as px
 import plotly.graph_objects as go
 
 
 # ────────────────────────────────
-# 🔁 Manage active tab navigation manually
+# PAGE CONFIG (must be the first Streamlit call)
 # ────────────────────────────────
-if "active_tab" not in st.session_state:
-    st.session_state.active_tab = "tab_gen"  # or whichever tab should open by default
-
-def switch_tab(tab_name: str):
-    """Programmatically switch between workflow tabs."""
-    st.session_state.active_tab = tab_name
-    st.rerun()
+st.set_page_config(
+    page_title="AI Agent Sandbox — By the People, For the People",
+    layout="wide",
+)
 
 
 # ─────────────────────────────────────────────
 # 🌌 GLOBAL DARK THEME + BLUE GLOW ENHANCED UI
-st.markdown("""
+# All app styles live in one constant and are emitted once per run.
+_APP_CSS = """
 <style>
 /* ─────────────────────────────
    GLOBAL BACKGROUND + TEXT
@@ -172,14 +181,7 @@ a:hover {
 ::-webkit-scrollbar-thumb:hover {
     background: #60a5fa;
 }
-</style>
-""", unsafe_allow_html=True)
 
-# ─────────────────────────────────────────────
-# 🌟 READABILITY & INPUT FIELD FIX PATCH
-
-st.markdown("""
-<style>
 /* ─────────────────────────────
    FIX: Input Fields + Dropdowns Too Dark
 ───────────────────────────── */
@@ -254,10 +256,7 @@ div[data-baseweb="tab"] > button {
 .stMarkdown, .stText, p, span, div {
     font-size: 18px !important;
 }
-</style>
-""", unsafe_allow_html=True)
-st.markdown("""
-<style>
+
 /* Brighten all radio + checkbox labels */
 div[role="radio"], div[role="checkbox"] label, label[data-baseweb="radio"], label[data-baseweb="checkbox"] {
     color: #f8fafc !important;
@@ -283,11 +282,74 @@ div[role="radio"] p, div[role="checkbox"] p {
     font-size: 18px !important;
     font-weight: 700 !important;
 }
+
+/* ─────────────────────────────
+   LANDING / AGENTS LAYOUT
+───────────────────────────── */
+html, body, .block-container { background-color:#0f172a !important; color:#e2e8f0 !important; }
+footer { text-align:center; padding:2rem; color:#aab3c2; font-size:1.2rem; font-weight:600; margin-top:2rem; }
+.left-box {
+    background: radial-gradient(circle at top left, #0f172a, #1e293b);
+    border-radius:20px; padding:3rem 2rem; color:#f1f5f9; box-shadow:6px 0 24px rgba(0,0,0,0.4);
+}
+.right-box {
+    background:linear-gradient(180deg,#1e293b,#0f172a);
+    border-radius:20px; padding:2rem; box-shadow:-6px 0 24px rgba(0,0,0,0.35);
+}
+.stButton > button {
+    border:none !important; cursor:pointer;
+    padding:14px 28px !important; font-size:18px !important; font-weight:700 !important;
+    border-radius:14px !important; color:#fff !important;
+    background:linear-gradient(180deg,#4ea3ff 0%,#2f86ff 60%,#0f6fff 100%) !important;
+    box-shadow:0 8px 24px rgba(15,111,255,0.35);
+}
+a.macbtn {
+    display:inline-block; text-decoration:none !important; color:#fff !important;
+    padding:10px 22px; font-weight:700; border-radius:12px;
+    background:linear-gradient(180deg,#4ea3ff 0%,#2f86ff 60%,#0f6fff 100%);
+}
+/* Larger workflow tabs */
+[data-testid="stTabs"] [data-baseweb="tab"] {
+    font-size: 28px !important;
+    font-weight: 800 !important;
+    padding: 20px 40px !important;
+    border-radius: 12px !important;
+    background-color: #1e293b !important;
+    color: #f8fafc !important;
+}
+[data-testid="stTabs"] [data-baseweb="tab"][aria-selected="true"] {
+    background: linear-gradient(90deg, #2563eb, #1d4ed8) !important;
+    color: white !important;
+    border-bottom: 6px solid #60a5fa !important;
+    box-shadow: 0 4px 14px rgba(37,99,235,0.5);
+}
+</style>
+"""
+st.markdown(_APP_CSS, unsafe_allow_html=True)
+
+# Large download-button style; injected by the run tab only after a successful run.
+_DOWNLOAD_BTN_CSS = """
+<style>
+div[data-testid="stDownloadButton"] button {
+    font-size: 90px !important;
+    font-weight: 900 !important;
+    padding: 28px 48px !important;
+    border-radius: 16px !important;
+    background: linear-gradient(90deg, #2563eb, #1d4ed8) !important;
+    color: white !important;
+    border: none !important;
+    box-shadow: 0 6px 18px rgba(0,0,0,0.35) !important;
+    transition: all 0.3s ease-in-out !important;
+}
+div[data-testid="stDownloadButton"] button:hover {
+    background: linear-gradient(90deg, #1e3a8a, #1d4ed8) !important;
+    transform: scale(1.03);
+}
 </style>
-""", unsafe_allow_html=True)
+"""
 
 # ─────────────────────────────────────────────
-# 🔁 Manage active tab navigation manually (INSERT HERE)
+# 🔁 Manage active tab navigation manually
 # ─────────────────────────────────────────────
 if "active_tab" not in st.session_state:
     st.session_state.active_tab = "tab_gen"  # or tab_train if you want to start from training
@@ -314,28 +376,31 @@ API_URL = os.getenv("API_URL", "http://localhost:8090")
 # ────────────────────────────────
 # SESSION STATE INIT
 # ────────────────────────────────
-if "stage" not in st.session_state:
-    st.session_state.stage = "landing"
-if "user_info" not in st.session_state:
-    st.session_state.user_info = {"name": "", "email": "", "flagged": False}
-if "logged_in" not in st.session_state:
-    st.session_state.logged_in = False
-if "flagged" not in st.session_state.user_info:
-    st.session_state.user_info["flagged"] = False
-if "timestamp" not in st.session_state.user_info:
-    st.session_state.user_info["timestamp"] = datetime.datetime.utcnow().isoformat()
-
-# ────────────────────────────────
-# PAGE CONFIG
-# ────────────────────────────────
-st.set_page_config(
-    page_title="AI Agent Sandbox — By the People, For the People",
-    layout="wide",
-)
+# One sentinel check per rerun; defaults are written once per browser session.
+# (Login replaces user_info with a dict that already carries flagged/timestamp.)
+if not st.session_state.get("_state_inited"):
+    defaults = {
+        "stage": "landing",
+        "user_info": {"name": "", "email": "", "flagged": False},
+        "logged_in": False,
+    }
+    st.session_state.update({k: v for k, v in defaults.items() if k not in st.session_state})
+    st.session_state.user_info.setdefault("flagged", False)
+    st.session_state.user_info.setdefault("timestamp", datetime.datetime.utcnow().isoformat())
+    st.session_state["_state_inited"] = True
 
 # ────────────────────────────────
 # HELPERS
 # ────────────────────────────────
+def _goto(stage: str) -> None:
+    """on_click handler for stage navigation buttons.
+
+    Callbacks run before the script reruns, so the click's own rerun already renders the
+    new stage; no second st.rerun() pass is needed.
+    """
+    st.session_state.stage = stage
+
+
 def _clear_qp():
     """Clear query params (modern Streamlit API)."""
     try:
@@ -344,12 +409,27 @@ def _clear_qp():
         pass
 
 
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg")
+
+
+@st.cache_resource
+def _image_index() -> Dict[str, str]:
+    """base name -> path for LANDING_IMG_DIR, first extension in IMAGE_EXTS wins."""
+    index: Dict[str, str] = {}
+    best: Dict[str, int] = {}
+    for f in os.listdir(LANDING_IMG_DIR):
+        base, ext = os.path.splitext(f)
+        if ext not in IMAGE_EXTS:
+            continue
+        rank = IMAGE_EXTS.index(ext)
+        if rank < best.get(base, len(IMAGE_EXTS)):
+            best[base] = rank
+            index[base] = os.path.join(LANDING_IMG_DIR, f)
+    return index
+
+
 def load_image(base: str) -> Optional[str]:
-    for ext in [".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg"]:
-        p = os.path.join(LANDING_IMG_DIR, f"{base}{ext}")
-        if os.path.exists(p):
-            return p
-    return None
+    return _image_index().get(base)
 
 
 def save_uploaded_image(uploaded_file, base: str):
@@ -359,18 +439,25 @@ def save_uploaded_image(uploaded_file, base: str):
     dest = os.path.join(LANDING_IMG_DIR, f"{base}{ext}")
     with open(dest, "wb") as f:
         f.write(uploaded_file.getvalue())
+    _image_index.clear()
+    _img_data_uri.clear()
+    _agents_library_df.clear()
     return dest
 
 
-def render_image_tag(agent_id: str, industry: str, emoji_fallback: str) -> str:
+@st.cache_resource
+def _img_data_uri(path: str) -> str:
+    """Inline an image as a base64 data URI (browsers block file:// in app HTML)."""
+    with open(path, "rb") as f:
+        payload = base64.b64encode(f.read()).decode("ascii")
+    mime = mimetypes.guess_type(path)[0] or "image/png"
+    return f"data:{mime};base64,{payload}"
+
+
+def agent_image_uri(agent_id: str, industry: str) -> Optional[str]:
     base = agent_id.lower().replace(" ", "_")
     img_path = load_image(base) or load_image(industry.replace(" ", "_"))
-    if img_path:
-        return (
-            f'<img src="file://{img_path}" '
-            f'style="width:48px;height:48px;border-radius:10px;object-fit:cover;">'
-        )
-    return f'<div style="font-size:32px;">{emoji_fallback}</div>'
+    return _img_data_uri(img_path) if img_path else None
 
 
 # ────────────────────────────────
@@ -407,53 +494,18 @@ AGENTS = [
      "Estimate, optimize, and track film & production costs using AI", "Coming Soon", "🎬"),
 ]
 
-# ────────────────────────────────
-# STYLES
-# ────────────────────────────────
-st.markdown(
-    """
-    <style>
-    html, body, .block-container { background-color:#0f172a !important; color:#e2e8f0 !important; }
-    footer { text-align:center; padding:2rem; color:#aab3c2; font-size:1.2rem; font-weight:600; margin-top:2rem; }
-    .left-box {
-        background: radial-gradient(circle at top left, #0f172a, #1e293b);
-        border-radius:20px; padding:3rem 2rem; color:#f1f5f9; box-shadow:6px 0 24px rgba(0,0,0,0.4);
-    }
-    .right-box {
-        background:linear-gradient(180deg,#1e293b,#0f172a);
-        border-radius:20px; padding:2rem; box-shadow:-6px 0 24px rgba(0,0,0,0.35);
-    }
-    .stButton > button {
-        border:none !important; cursor:pointer;
-        padding:14px 28px !important; font-size:18px !important; font-weight:700 !important;
-        border-radius:14px !important; color:#fff !important;
-        background:linear-gradient(180deg,#4ea3ff 0%,#2f86ff 60%,#0f6fff 100%) !important;
-        box-shadow:0 8px 24px rgba(15,111,255,0.35);
-    }
-    a.macbtn {
-        display:inline-block; text-decoration:none !important; color:#fff !important;
-        padding:10px 22px; font-weight:700; border-radius:12px;
-        background:linear-gradient(180deg,#4ea3ff 0%,#2f86ff 60%,#0f6fff 100%);
-    }
-    /* Larger workflow tabs */
-    [data-testid="stTabs"] [data-baseweb="tab"] {
-        font-size: 28px !important;
-        font-weight: 800 !important;
-        padding: 20px 40px !important;
-        border-radius: 12px !important;
-        background-color: #1e293b !important;
-        color: #f8fafc !important;
-    }
-    [data-testid="stTabs"] [data-baseweb="tab"][aria-selected="true"] {
-        background: linear-gradient(90deg, #2563eb, #1d4ed8) !important;
-        color: white !important;
-        border-bottom: 6px solid #60a5fa !important;
-        box-shadow: 0 4px 14px rgba(37,99,235,0.5);
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+
+@st.cache_data(show_spinner=False)
+def _agents_library_df() -> pd.DataFrame:
+    """Landing-page agent library; AGENTS is static so the frame (and its image URIs) is built once."""
+    return pd.DataFrame(
+        [
+            (agent_image_uri(agent, industry), sector, industry, agent, desc, status)
+            for sector, industry, agent, desc, status, _emoji in AGENTS
+        ],
+        columns=["🖼️", "🏭 Sector", "🧩 Industry", "🤖 Agent", "🧠 Description", "📶 Status"],
+    )
+
 
 # ────────────────────────────────
 # QUERY PARAM ROUTING (modern API)
@@ -463,17 +515,17 @@ try:
 except Exception:
     qp = {}
 
+# Routing runs before any stage is rendered, so updating the stage here is enough:
+# the rest of this same run already renders the new stage (no st.rerun round trip).
 if "stage" in qp:
     target = qp["stage"]
     if target in {"landing", "agents", "login", "credit_agent"} and st.session_state.stage != target:
         st.session_state.stage = target
         _clear_qp()
-        st.rerun()
 
 if "launch" in qp or ("agent" in qp and qp.get("agent") == ["credit"]):
     st.session_state.stage = "login"
     _clear_qp()
-    st.rerun()
 
 # ────────────────────────────────
 # STAGE: LANDING
@@ -500,24 +552,17 @@ if st.session_state.stage == "landing":
             """,
             unsafe_allow_html=True,
         )
-        if st.button("🚀 Start Building Now", key="btn_start_build_now"):
-            st.session_state.stage = "agents"
-            st.rerun()
+        st.button("🚀 Start Building Now", key="btn_start_build_now", on_click=_goto, args=("agents",))
         st.markdown("</div>", unsafe_allow_html=True)
     with c2:
         st.markdown("<div class='right-box'>", unsafe_allow_html=True)
         st.markdown("<h2>📊 Global AI Agent Library</h2>", unsafe_allow_html=True)
-        rows = []
-        for sector, industry, agent, desc, status, emoji in AGENTS:
-            rows.append({
-                "🖼️": render_image_tag(agent, industry, emoji),
-                "🏭 Sector": sector,
-                "🧩 Industry": industry,
-                "🤖 Agent": agent,
-                "🧠 Description": desc,
-                "📶 Status": f'<span style="color:{"#22c55e" if status=="Available" else "#f59e0b"};">{status}</span>'
-            })
-        st.write(pd.DataFrame(rows).to_html(escape=False, index=False), unsafe_allow_html=True)
+        st.dataframe(
+            _agents_library_df(),
+            use_container_width=True,
+            hide_index=True,
+            column_config={"🖼️": st.column_config.ImageColumn("🖼️", width="small")},
+        )
         st.markdown("</div>", unsafe_allow_html=True)
     st.markdown("<footer>Made with ❤️ by Dzoan Nguyen — Open AI Sandbox Initiative</footer>", unsafe_allow_html=True)
     st.stop()
@@ -528,9 +573,7 @@ if st.session_state.stage == "landing":
 if st.session_state.stage == "agents":
     top = st.columns([1, 4, 1])
     with top[0]:
-        if st.button("⬅️ Back to Home", key="btn_back_home_from_agents"):
-            st.session_state.stage = "landing"
-            st.rerun()
+        st.button("⬅️ Back to Home", key="btn_back_home_from_agents", on_click=_goto, args=("landing",))
     with top[1]:
         st.title("🤖 Available AI Agents")
 
@@ -553,9 +596,7 @@ if st.session_state.stage == "agents":
 if st.session_state.stage == "login":
     top = st.columns([1, 4, 1])
     with top[0]:
-        if st.button("⬅️ Back to Agents", key="btn_back_agents_from_login"):
-            st.session_state.stage = "agents"
-            st.rerun()
+        st.button("⬅️ Back to Agents", key="btn_back_agents_from_login", on_click=_goto, args=("agents",))
     with top[1]:
         st.title("🔐 Login to AI Credit Appraisal Platform")
     c1, c2, c3 = st.columns([1, 1, 1])
@@ -587,9 +628,7 @@ if st.session_state.stage == "login":
 if st.session_state.stage == "credit_agent":
     top = st.columns([1, 4, 1])
     with top[0]:
-        if st.button("⬅️ Back to Agents", key="btn_back_agents_from_pipeline"):
-            st.session_state.stage = "agents"
-            st.rerun()
+        st.button("⬅️ Back to Agents", key="btn_back_agents_from_pipeline", on_click=_goto, args=("agents",))
     with top[1]:
         st.title("💳 AI Credit Appraisal Platform")
         st.caption("Generate, sanitize, and appraise credit with AI agent power and human insight.")
@@ -607,24 +646,39 @@ PII_COLS = {"customer_name", "name", "email", "phone", "address", "ssn", "nation
 
 EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 PHONE_RE = re.compile(r"\+?\d[\d\-\s]{6,}\d")
+# any column whose name contains a PII token (case-insensitive)
+PII_COL_RE = re.compile("|".join(map(re.escape, sorted(PII_COLS))), re.IGNORECASE)
+
+# Columns shown in the compact decisions table, in display order.
+_COLS_SHOW = (
+    "application_id", "customer_type", "decision", "score", "loan_amount", "income",
+    "metrics_met", "metrics_unmet", "proposed_loan_option", "proposed_consolidation_loan",
+    "top_feature", "explanation",
+)
 
 def dedupe_columns(df: pd.DataFrame) -> pd.DataFrame:
-    return df.loc[:, ~df.columns.duplicated(keep="last")]
-
-def scrub_text_pii(s):
-    if not isinstance(s, str):
-        return s
-    s = EMAIL_RE.sub("", s)
-    s = PHONE_RE.sub("", s)
-    return s.strip()
+    dup = df.columns.duplicated(keep="last")
+    if not dup.any():
+        return df
+    return df.loc[:, ~dup]
 
 def drop_pii_columns(df: pd.DataFrame):
-    original_cols = list(df.columns)
-    keep_cols = [c for c in original_cols if all(k not in c.lower() for k in PII_COLS)]
-    dropped = [c for c in original_cols if c not in keep_cols]
-    out = df[keep_cols].copy()
+    is_pii = df.columns.astype(str).str.contains(PII_COL_RE)
+    dropped = df.columns[is_pii].tolist()
+    out = df.loc[:, ~is_pii].copy()
     for c in out.select_dtypes(include="object"):
-        out[c] = out[c].apply(scrub_text_pii)
+        col = out[c]
+        all_str = pd.api.types.infer_dtype(col, skipna=False) == "string"
+        is_str = None if all_str else col.map(type) == str
+        if is_str is not None and not is_str.any():
+            continue
+        scrubbed = (
+            col.str.replace(EMAIL_RE, "", regex=True)
+               .str.replace(PHONE_RE, "", regex=True)
+               .str.strip()
+        )
+        # .str turns non-string cells into NaN, so keep those cells as they were
+        out[c] = scrubbed if all_str else scrubbed.where(is_str, col)
     return dedupe_columns(out), dropped
 
 def strip_policy_banned(df: pd.DataFrame) -> pd.DataFrame:
@@ -638,21 +692,68 @@ def strip_policy_banned(df: pd.DataFrame) -> pd.DataFrame:
 
 def append_user_info(df: pd.DataFrame) -> pd.DataFrame:
     meta = st.session_state["user_info"]
-    out = df.copy()
+    out = df.copy(deep=False)  # only adds columns; existing data is never written
     out["session_user_name"] = meta["name"]
     out["session_user_email"] = meta["email"]
     out["session_flagged"] = meta["flagged"]
     out["created_at"] = meta["timestamp"]
     return dedupe_columns(out)
 
-def save_to_runs(df: pd.DataFrame, prefix: str) -> str:
+def _write_csv(df: pd.DataFrame, dest) -> None:
+    """Index-free CSV to a path or binary buffer via Arrow's C++ writer (pandas for columns Arrow can't type)."""
+    try:
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), dest)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        if hasattr(dest, "truncate"):
+            dest.seek(0)
+            dest.truncate()
+        df.to_csv(dest, index=False)
+
+def save_to_runs(df: pd.DataFrame, prefix: str, fmt: str = "parquet") -> str:
+    """Persist a run artifact; Parquet by default (typed, compressed), CSV on request
+    or when a column has mixed types Arrow can't store.
+
+    Download buttons render CSV from the in-memory frame, so the on-disk format is free to differ.
+    """
     ts = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M")
     flag_suffix = "_FLAGGED" if st.session_state["user_info"]["flagged"] else ""
-    fname = f"{prefix}_{ts}{flag_suffix}.csv"
-    fpath = os.path.join(RUNS_DIR, fname)
-    dedupe_columns(df).to_csv(fpath, index=False)
+    stem = os.path.join(RUNS_DIR, f"{prefix}_{ts}{flag_suffix}")
+    out = dedupe_columns(df)
+    if fmt == "parquet":
+        fpath = f"{stem}.parquet"
+        try:
+            out.to_parquet(fpath, engine="pyarrow", compression="snappy", index=False)
+            return fpath
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            if os.path.exists(fpath):
+                os.remove(fpath)
+    fpath = f"{stem}.csv"
+    _write_csv(out, fpath)
     return fpath
 
+@st.cache_data(max_entries=8, show_spinner=False)
+def _parse_csv(raw: bytes) -> pd.DataFrame:
+    """Parse an uploaded CSV once per distinct payload; reruns reuse the cached frame."""
+    try:
+        return pd.read_csv(io.BytesIO(raw), engine="pyarrow")
+    except Exception:
+        return pd.read_csv(io.BytesIO(raw))
+
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Index-free CSV payload (uncached)."""
+    buf = io.BytesIO()
+    _write_csv(df, buf)
+    return buf.getvalue()
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """CSV payload for download buttons, so reruns don't re-serialize the same frame.
+
+    cache_data hashes large frames from a row sample, so frames the user edits must use
+    df_to_csv_bytes instead: an edit to an unsampled row would hit a stale entry.
+    """
+    return df_to_csv_bytes(df)
+
 def try_json(x):
     if isinstance(x, (dict, list)):
         return x
@@ -677,25 +778,80 @@ def fmt_currency_label(base: str) -> str:
     sym = st.session_state.get("currency_symbol", "")
     return f"{base} ({sym})" if sym else base
 
+@st.cache_resource
+def get_http() -> requests.Session:
+    """Shared keep-alive session for API calls; idempotent requests retry on gateway errors."""
+    sess = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    )
+    sess.mount("http://", adapter)
+    sess.mount("https://", adapter)
+    return sess
+
+@st.cache_data(ttl=10, show_spinner=False)
+def api_available() -> bool:
+    """One short /health probe per window, so a down API costs one timeout rather than one per call."""
+    try:
+        # plain requests.get: the pooled session's Retry would turn a refused connection into 3 attempts
+        return requests.get(f"{API_URL}/health", timeout=1).ok
+    except Exception:
+        return False
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_production_meta() -> Optional[Dict[str, Any]]:
+    """Production model meta, fetched at most every 30 s; None on a non-OK reply, raises if the API is down."""
+    if not api_available():
+        raise ConnectionError(f"API not reachable at {API_URL}")
+    resp = get_http().get(f"{API_URL}/v1/training/production_meta", timeout=5)
+    return resp.json() if resp.ok else None
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """Process-wide worker pool for slow API calls (train/promote) so the script never blocks on them."""
+    return ThreadPoolExecutor(max_workers=2)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def list_trained_models(trained_dir: str) -> List[tuple]:
+    """(file name, path, created label) for every .joblib in trained_dir, newest first."""
+    models = []
+    if os.path.exists(trained_dir):
+        for f in os.listdir(trained_dir):
+            if f.endswith(".joblib"):
+                fpath = os.path.join(trained_dir, f)
+                ctime = os.path.getctime(fpath)
+                created = datetime.datetime.fromtimestamp(ctime).strftime("%b %d, %Y %H:%M")
+                models.append((f, fpath, created))
+    models.sort(key=lambda x: x[2], reverse=True)
+    return models
+
 # ─────────────────────────────────────────────
 # CURRENCY CATALOG
 
+class Currency(NamedTuple):
+    label: str
+    symbol: str
+    fx: float  # applied to USD-like base generated numbers
+
 CURRENCY_OPTIONS = {
-    # code: (label, symbol, fx to apply on USD-like base generated numbers)
-    "USD": ("USD $", "$", 1.0),
-    "EUR": ("EUR €", "€", 0.93),
-    "GBP": ("GBP £", "£", 0.80),
-    "JPY": ("JPY ¥", "¥", 150.0),
-    "VND": ("VND ₫", "₫", 24000.0),
+    "USD": Currency("USD $", "$", 1.0),
+    "EUR": Currency("EUR €", "€", 0.93),
+    "GBP": Currency("GBP £", "£", 0.80),
+    "JPY": Currency("JPY ¥", "¥", 150.0),
+    "VND": Currency("VND ₫", "₫", 24000.0),
 }
 
 def set_currency_defaults():
-    if "currency_code" not in st.session_state:
-        st.session_state["currency_code"] = "USD"
-    label, symbol, fx = CURRENCY_OPTIONS[st.session_state["currency_code"]]
-    st.session_state["currency_label"] = label
-    st.session_state["currency_symbol"] = symbol
-    st.session_state["currency_fx"] = fx
+    code = st.session_state.setdefault("currency_code", "USD")
+    if st.session_state.get("_currency_applied") == code:
+        return  # label/symbol/fx already match the selected code
+    cur = CURRENCY_OPTIONS[code]
+    st.session_state["currency_label"] = cur.label
+    st.session_state["currency_symbol"] = cur.symbol
+    st.session_state["currency_fx"] = cur.fx
+    st.session_state["_currency_applied"] = code
 
 set_currency_defaults()
 
@@ -714,6 +870,32 @@ def _kpi_card(label: str, value: str, sublabel: str | None = None):
         unsafe_allow_html=True,
     )
 
+# st.fragment graduated from experimental in 1.37; keep the older alias working.
+_fragment = getattr(st, "fragment", None) or st.experimental_fragment
+
+@_fragment
+def _decision_table(merged_df: pd.DataFrame):
+    """
+    Filtered decisions table. Runs as a fragment so changing the decision
+    filter only reruns this block, not the dashboard or the rest of the page.
+    """
+    st.markdown("### 📄 Credit Ai Agent  Decisions Table (filtered)")
+    uniq_dec = sorted([d for d in merged_df.get("decision", pd.Series(dtype=str)).dropna().unique()])
+    chosen = st.multiselect("Filter decision", options=uniq_dec, default=uniq_dec, key="filter_decisions")
+    df_view = merged_df.copy()
+    if "decision" in df_view.columns and chosen:
+        df_view = df_view[df_view["decision"].isin(chosen)]
+    st.dataframe(df_view, use_container_width=True)
+
+    # Per-row metrics met/not met
+    if "rule_reasons" in df_view.columns:
+        rr = df_view["rule_reasons"].apply(try_json)
+        df_view["metrics_met"] = rr.apply(lambda d: ", ".join(sorted([k for k, v in (d or {}).items() if v is True])) if isinstance(d, dict) else "")
+        df_view["metrics_unmet"] = rr.apply(lambda d: ", ".join(sorted([k for k, v in (d or {}).items() if v is False])) if isinstance(d, dict) else "")
+    cols_present = df_view.columns
+    cols_show = [c for c in _COLS_SHOW if c in cols_present]
+    st.dataframe(df_view[cols_show].head(500), use_container_width=True)
+
 def render_credit_dashboard(df: pd.DataFrame, currency_symbol: str = ""):
     """
     Renders the whole dashboard (TOP-10s → Opportunities → KPIs & pies/bars → Mix table).
@@ -723,16 +905,19 @@ def render_credit_dashboard(df: pd.DataFrame, currency_symbol: str = ""):
         st.info("No data to visualize yet.")
         return
 
-    cols = df.columns
+    cols = frozenset(df.columns)  # one hashed schema for every section check below
+    # normalized decision labels, computed once for every approved/denied mask below
+    decision_lc = df["decision"].astype(str).str.lower() if "decision" in cols else None
 
     # ─────────────── TOP 10s FIRST ───────────────
     st.markdown("## 🔝 Top 10 Snapshot")
 
     # Top 10 loans approved
-    if {"decision", "loan_amount", "application_id"} <= set(cols):
-        top_approved = df[df["decision"].astype(str).str.lower() == "approved"].copy()
-        if not top_approved.empty:
-            top_approved = top_approved.sort_values("loan_amount", ascending=False).head(10)
+    if {"decision", "loan_amount", "application_id"} <= cols:
+        approved_mask = decision_lc == "approved"
+        if approved_mask.any():
+            # only the 10 plotted rows/columns go to the chart payload
+            top_approved = df.loc[approved_mask, ["application_id", "loan_amount"]].nlargest(10, "loan_amount")
             fig = px.bar(
                 top_approved,
                 x="loan_amount",
@@ -747,7 +932,7 @@ def render_credit_dashboard(df: pd.DataFrame, currency_symbol: str = ""):
             st.info("No approved loans available to show top 10.")
 
     # Top 10 collateral types by average value
-    if {"collateral_type", "collateral_value"} <= set(cols):
+    if {"collateral_type", "collateral_value"} <= cols:
         cprof = df.groupby("collateral_type", dropna=False).agg(
             avg_value=("collateral_value", "mean"),
             cnt=("collateral_type", "count")
@@ -768,17 +953,16 @@ def render_credit_dashboard(df: pd.DataFrame, currency_symbol: str = ""):
 
     # Top 10 reasons for denial (from rule_reasons False flags)
     if "rule_reasons" in cols and "decision" in cols:
-        denied = df[df["decision"].astype(str).str.lower() == "denied"].copy()
-        reasons_count = {}
-        for _, r in denied.iterrows():
-            rr = _safe_json(r.get("rule_reasons"))
-            if isinstance(rr, dict):
-                for k, v in rr.items():
-                    if v is False:
-                        reasons_count[k] = reasons_count.get(k, 0) + 1
+        # only the rule_reasons column of denied rows, not a Series per row
+        reasons_count = Counter(
+            k
+            for rr in df.loc[decision_lc == "denied", "rule_reasons"].map(_safe_json)
+            if isinstance(rr, dict)
+            for k, v in rr.items()
+            if v is False
+        )
         if reasons_count:
-            items = pd.DataFrame(sorted(reasons_count.items(), key=lambda x: x[1], reverse=True),
-                                 columns=["reason", "count"]).head(10)
+            items = pd.DataFrame(reasons_count.most_common(10), columns=["reason", "count"])
             fig = px.bar(
                 items, x="count", y="reason", orientation="h",
                 title="Top 10 Reasons for Denial",
@@ -797,7 +981,7 @@ def render_credit_dashboard(df: pd.DataFrame, currency_symbol: str = ""):
             break
     if officer_col and "decision" in cols:
         perf = (
-            df.assign(is_approved=(df["decision"].astype(str).str.lower() == "approved").astype(int))
+            df.assign(is_approved=(decision_lc == "approved").astype(int))
               .groupby(officer_col, dropna=False)["is_approved"]
               .agg(approved_rate="mean", n="count")
               .reset_index()
@@ -819,59 +1003,67 @@ def render_credit_dashboard(df: pd.DataFrame, currency_symbol: str = ""):
     # ─────────────── OPPORTUNITIES ───────────────
     st.markdown("## 💡 Opportunities")
 
+    def _num(col):
+        if col not in cols:
+            return pd.Series(0.0, index=df.index)
+        # NaN stays NaN so the masks below leave incomplete rows out
+        return pd.to_numeric(df[col], errors="coerce")
+
+    def _col(col):
+        return df[col] if col in cols else pd.Series(None, index=df.index, dtype=object)
+
     # Short-term loan opportunities (simple heuristic)
-    opp_rows = []
-    if {"income", "loan_amount"}.issubset(cols):
+    opp_df = pd.DataFrame()
+    if {"income", "loan_amount"} <= cols:
         term_col = "loan_term_months" if "loan_term_months" in cols else ("loan_duration_months" if "loan_duration_months" in cols else None)
         if term_col:
-            for _, r in df.iterrows():
-                inc = float(r.get("income", 0) or 0)
-                amt = float(r.get("loan_amount", 0) or 0)
-                term = int(r.get(term_col, 0) or 0)
-                dti = float(r.get("DTI", 0) or 0)
-                if (term >= 36) and (amt <= inc * 0.8) and (dti <= 0.45):
-                    opp_rows.append({
-                        "application_id": r.get("application_id"),
-                        "suggested_term": 24,
-                        "loan_amount": amt,
-                        "income": inc,
-                        "DTI": dti,
-                        "note": "Candidate for short-term plan (<=24m) based on affordability."
-                    })
-    if opp_rows:
+            inc = _num("income")
+            amt = _num("loan_amount")
+            dti = _num("DTI")
+            mask = (_num(term_col) >= 36) & (amt <= inc * 0.8) & (dti <= 0.45)
+            if mask.any():
+                opp_df = pd.DataFrame({
+                    "application_id": _col("application_id")[mask],
+                    "suggested_term": 24,
+                    "loan_amount": amt[mask],
+                    "income": inc[mask],
+                    "DTI": dti[mask],
+                    "note": "Candidate for short-term plan (<=24m) based on affordability.",
+                }).reset_index(drop=True)
+    if not opp_df.empty:
         st.markdown("#### 📎 Short-Term Loan Candidates")
-        st.dataframe(pd.DataFrame(opp_rows).head(25), use_container_width=True, height=320)
+        st.dataframe(opp_df.head(25), use_container_width=True, height=320)
     else:
         st.info("No short-term loan candidates identified in this batch.")
 
     st.markdown("#### 🔁 Buyback / Consolidation Beneficiaries")
-    candidates = []
+    cand_df = pd.DataFrame()
     need = {"decision", "existing_debt", "loan_amount", "DTI"}
-    if need <= set(cols):
-        for _, r in df.iterrows():
-            dec = str(r.get("decision", "")).lower()
-            debt = float(r.get("existing_debt", 0) or 0)
-            loan = float(r.get("loan_amount", 0) or 0)
-            dti = float(r.get("DTI", 0) or 0)
-            proposal = _safe_json(r.get("proposed_consolidation_loan", {}))
-            has_bb = bool(proposal)
-
-            if dec == "denied" or dti > 0.45 or debt > loan:
-                benefit_score = round((debt / (loan + 1e-6)) * 0.4 + dti * 0.6, 2)
-                candidates.append({
-                    "application_id": r.get("application_id"),
-                    "customer_type": r.get("customer_type"),
-                    "existing_debt": debt,
-                    "loan_amount": loan,
-                    "DTI": dti,
-                    "collateral_type": r.get("collateral_type"),
-                    "buyback_proposed": has_bb,
-                    "buyback_amount": proposal.get("buyback_amount") if has_bb else None,
-                    "benefit_score": benefit_score,
-                    "note": proposal.get("note") if has_bb else None
-                })
-    if candidates:
-        cand_df = pd.DataFrame(candidates).sort_values("benefit_score", ascending=False)
+    if need <= cols:
+        debt = _num("existing_debt")
+        loan = _num("loan_amount")
+        dti = _num("DTI")
+        mask = (decision_lc == "denied") | (dti > 0.45) | (debt > loan)
+        if mask.any():
+            proposal = _col("proposed_consolidation_loan")[mask].map(_safe_json)
+            has_bb = proposal.astype(bool)
+            bb_field = lambda key: proposal.map(
+                lambda p: p.get(key) if isinstance(p, dict) else None
+            ).where(has_bb, None)
+            cand_df = pd.DataFrame({
+                "application_id": _col("application_id")[mask],
+                "customer_type": _col("customer_type")[mask],
+                "existing_debt": debt[mask],
+                "loan_amount": loan[mask],
+                "DTI": dti[mask],
+                "collateral_type": _col("collateral_type")[mask],
+                "buyback_proposed": has_bb,
+                "buyback_amount": bb_field("buyback_amount"),
+                "benefit_score": ((debt[mask] / (loan[mask] + 1e-6)) * 0.4 + dti[mask] * 0.6).round(2),
+                "note": bb_field("note"),
+            })
+    if not cand_df.empty:
+        cand_df = cand_df.sort_values("benefit_score", ascending=False).reset_index(drop=True)
         st.dataframe(cand_df.head(25), use_container_width=True, height=380)
     else:
         st.info("No additional buyback beneficiaries identified.")
@@ -885,18 +1077,18 @@ def render_credit_dashboard(df: pd.DataFrame, currency_symbol: str = ""):
     # Approval rate
     if "decision" in cols:
         total = len(df)
-        approved = int((df["decision"].astype(str).str.lower() == "approved").sum())
+        approved = int((decision_lc == "approved").sum())
         rate = (approved / total * 100) if total else 0.0
         with c1: _kpi_card("Approval Rate", f"{rate:.1f}%", f"{approved} of {total}")
 
     # Avg approved loan amount
-    if {"decision", "loan_amount"} <= set(cols):
-        ap = df[df["decision"].astype(str).str.lower() == "approved"]["loan_amount"]
+    if {"decision", "loan_amount"} <= cols:
+        ap = df.loc[decision_lc == "approved", "loan_amount"]
         avg_amt = ap.mean() if len(ap) else 0.0
         with c2: _kpi_card("Avg Approved Amount", f"{currency_symbol}{avg_amt:,.0f}")
 
     # Decision time (if present)
-    if {"created_at", "decision_at"} <= set(cols):
+    if {"created_at", "decision_at"} <= cols:
         try:
             t = (pd.to_datetime(df["decision_at"]) - pd.to_datetime(df["created_at"])).dt.total_seconds() / 60.0
             avg_min = float(t.mean())
@@ -947,7 +1139,7 @@ def render_credit_dashboard(df: pd.DataFrame, currency_symbol: str = ""):
         st.plotly_chart(fig, use_container_width=True)
 
     # Collateral avg value by type (bar)
-    if {"collateral_type", "collateral_value"} <= set(cols):
+    if {"collateral_type", "collateral_value"} <= cols:
         cprof = df.groupby("collateral_type").agg(
             avg_col=("collateral_value", "mean"),
             cnt=("collateral_type", "count")
@@ -965,11 +1157,14 @@ def render_credit_dashboard(df: pd.DataFrame, currency_symbol: str = ""):
     if "proposed_loan_option" in cols:
         plans = df["proposed_loan_option"].dropna().astype(str)
         if len(plans) > 0:
-            plan_types = []
-            for s in plans:
-                p = _safe_json(s)
-                plan_types.append(p.get("type") if isinstance(p, dict) and "type" in p else s)
-            plan_df = pd.Series(plan_types).value_counts().head(10).rename_axis("plan").reset_index(name="count")
+            # aggregate on the raw strings first, then parse each distinct payload once
+            raw_counts = plans.value_counts()
+            plan_types = [
+                p.get("type") if isinstance(p, dict) and "type" in p else s
+                for s, p in zip(raw_counts.index, map(_safe_json, raw_counts.index))
+            ]
+            plan_counts = raw_counts.groupby(plan_types, sort=False).sum().sort_values(ascending=False, kind="stable")
+            plan_df = plan_counts.head(10).rename_axis("plan").reset_index(name="count")
             fig = px.bar(
                 plan_df, x="count", y="plan", orientation="h",
                 title="Top 10 Proposed Plans"
@@ -997,92 +1192,92 @@ tab_gen, tab_clean, tab_run, tab_review, tab_train = st.tabs([
 # ─────────────────────────────────────────────
 # DATA GENERATORS
 
-def generate_raw_synthetic(n: int, non_bank_ratio: float) -> pd.DataFrame:
+_NAMES = np.array([
+    "Alice Nguyen","Bao Tran","Chris Do","Duy Le","Emma Tran",
+    "Felix Nguyen","Giang Ho","Hanh Vo","Ivan Pham","Julia Ngo",
+], dtype=object)
+_EMAILS = np.array(
+    [f"{n.split()[0].lower()}.{n.split()[1].lower()}@gmail.com" for n in _NAMES], dtype=object
+)
+_ADDRESSES = np.array([
+    "23 Elm St, Boston, MA","19 Pine Ave, San Jose, CA","14 High St, London, UK",
+    "55 Nguyen Hue, Ho Chi Minh","78 Oak St, Chicago, IL","10 Broadway, New York, NY",
+    "8 Rue Lafayette, Paris, FR","21 Königstr, Berlin, DE","44 Maple Dr, Los Angeles, CA","22 Bay St, Toronto, CA",
+], dtype=object)
+
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def generate_raw_synthetic(n: int, non_bank_ratio: float, currency_code: str) -> pd.DataFrame:
+    """Seeded synthetic applicants; pure in its arguments (fx comes from CURRENCY_OPTIONS), hence cacheable."""
+    fx = CURRENCY_OPTIONS[currency_code].fx
     rng = np.random.default_rng(42)
-    names = ["Alice Nguyen","Bao Tran","Chris Do","Duy Le","Emma Tran",
-             "Felix Nguyen","Giang Ho","Hanh Vo","Ivan Pham","Julia Ngo"]
-    emails = [f"{n.split()[0].lower()}.{n.split()[1].lower()}@gmail.com" for n in names]
-    addrs = [
-        "23 Elm St, Boston, MA","19 Pine Ave, San Jose, CA","14 High St, London, UK",
-        "55 Nguyen Hue, Ho Chi Minh","78 Oak St, Chicago, IL","10 Broadway, New York, NY",
-        "8 Rue Lafayette, Paris, FR","21 Königstr, Berlin, DE","44 Maple Dr, Los Angeles, CA","22 Bay St, Toronto, CA"
-    ]
     is_non = rng.random(n) < non_bank_ratio
     cust_type = np.where(is_non, "non-bank", "bank")
 
     df = pd.DataFrame({
-        "application_id": [f"APP_{i:04d}" for i in range(1, n + 1)],
-        "customer_name": np.random.choice(names, n),
-        "email": np.random.choice(emails, n),
-        "phone": [f"+1-202-555-{1000+i:04d}" for i in range(n)],
-        "address": np.random.choice(addrs, n),
-        "national_id": rng.integers(10_000_000, 99_999_999, n),
-        "age": rng.integers(21, 65, n),
-        "income": rng.integers(25_000, 150_000, n),
-        "employment_length": rng.integers(0, 30, n),
-        "loan_amount": rng.integers(5_000, 100_000, n),
-        "loan_duration_months": rng.choice([12, 24, 36, 48, 60, 72], n),
-        "collateral_value": rng.integers(8_000, 200_000, n),
+        "application_id": np.char.mod("APP_%04d", np.arange(1, n + 1)),
+        "customer_name": rng.choice(_NAMES, n),
+        "email": rng.choice(_EMAILS, n),
+        "phone": np.char.add("+1-202-555-", np.arange(1000, 1000 + n).astype(str)),
+        "address": rng.choice(_ADDRESSES, n),
+        "national_id": rng.integers(10_000_000, 99_999_999, n, dtype=np.int32),
+        "age": rng.integers(21, 65, n, dtype=np.int8),
+        "income": rng.integers(25_000, 150_000, n, dtype=np.int32),
+        "employment_length": rng.integers(0, 30, n, dtype=np.int8),
+        "loan_amount": rng.integers(5_000, 100_000, n, dtype=np.int32),
+        "loan_duration_months": rng.choice(np.array([12, 24, 36, 48, 60, 72], dtype=np.int8), n),
+        "collateral_value": rng.integers(8_000, 200_000, n, dtype=np.int32),
         "collateral_type": rng.choice(["real_estate","car","land","deposit"], n),
-        "co_loaners": rng.choice([0,1,2], n, p=[0.7, 0.25, 0.05]),
-        "credit_score": rng.integers(300, 850, n),
-        "existing_debt": rng.integers(0, 50_000, n),
-        "assets_owned": rng.integers(10_000, 300_000, n),
-        "current_loans": rng.integers(0, 5, n),
+        "co_loaners": rng.choice(np.array([0, 1, 2], dtype=np.int8), n, p=[0.7, 0.25, 0.05]),
+        "credit_score": rng.integers(300, 850, n, dtype=np.int16),
+        "existing_debt": rng.integers(0, 50_000, n, dtype=np.int32),
+        "assets_owned": rng.integers(10_000, 300_000, n, dtype=np.int32),
+        "current_loans": rng.integers(0, 5, n, dtype=np.int8),
         "customer_type": cust_type,
     })
     eps = 1e-9
-    df["DTI"] = df["existing_debt"] / (df["income"] + eps)
-    df["LTV"] = df["loan_amount"] / (df["collateral_value"] + eps)
-    df["CCR"] = df["collateral_value"] / (df["loan_amount"] + eps)
-    df["ITI"] = (df["loan_amount"] / (df["loan_duration_months"] + eps)) / (df["income"] + eps)
-    df["CWI"] = ((1 - df["DTI"]).clip(0, 1)) * ((1 - df["LTV"]).clip(0, 1)) * (df["CCR"].clip(0, 3))
-
-    fx = st.session_state["currency_fx"]
-    for c in ("income", "loan_amount", "collateral_value", "assets_owned", "existing_debt"):
-        df[c] = (df[c] * fx).round(2)
-    df["currency_code"] = st.session_state["currency_code"]
+    income = df["income"].to_numpy(dtype=float)
+    debt = df["existing_debt"].to_numpy(dtype=float)
+    loan = df["loan_amount"].to_numpy(dtype=float)
+    coll = df["collateral_value"].to_numpy(dtype=float)
+    term = df["loan_duration_months"].to_numpy(dtype=float)
+    dti = debt / (income + eps)
+    ltv = loan / (coll + eps)
+    ccr = coll / (loan + eps)
+    iti = (loan / (term + eps)) / (income + eps)
+    cwi = np.clip(1 - dti, 0, 1) * np.clip(1 - ltv, 0, 1) * np.clip(ccr, 0, 3)
+    df = pd.concat(
+        [df, pd.DataFrame({"DTI": dti, "LTV": ltv, "CCR": ccr, "ITI": iti, "CWI": cwi}, index=df.index)],
+        axis=1,
+    )
+
+    if fx != 1.0:
+        money_cols = ["income", "loan_amount", "collateral_value", "assets_owned", "existing_debt"]
+        block = df[money_cols].to_numpy(dtype=np.float64)
+        np.multiply(block, fx, out=block)
+        np.round(block, 2, out=block)
+        df[money_cols] = block
+    df["currency_code"] = currency_code
     return dedupe_columns(df)
 
-def generate_anon_synthetic(n: int, non_bank_ratio: float) -> pd.DataFrame:
-    rng = np.random.default_rng(42)
-    is_non = rng.random(n) < non_bank_ratio
-    cust_type = np.where(is_non, "non-bank", "bank")
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def generate_anon_synthetic(n: int, non_bank_ratio: float, currency_code: str) -> pd.DataFrame:
+    """Same population as the RAW generator, with PII columns dropped."""
+    anon, _ = drop_pii_columns(generate_raw_synthetic(n, non_bank_ratio, currency_code))
+    return anon
 
-    df = pd.DataFrame({
-        "application_id": [f"APP_{i:04d}" for i in range(1, n + 1)],
-        "age": rng.integers(21, 65, n),
-        "income": rng.integers(25_000, 150_000, n),
-        "employment_length": rng.integers(0, 30, n),
-        "loan_amount": rng.integers(5_000, 100_000, n),
-        "loan_duration_months": rng.choice([12, 24, 36, 48, 60, 72], n),
-        "collateral_value": rng.integers(8_000, 200_000, n),
-        "collateral_type": rng.choice(["real_estate","car","land","deposit"], n),
-        "co_loaners": rng.choice([0,1,2], n, p=[0.7, 0.25, 0.05]),
-        "credit_score": rng.integers(300, 850, n),
-        "existing_debt": rng.integers(0, 50_000, n),
-        "assets_owned": rng.integers(10_000, 300_000, n),
-        "current_loans": rng.integers(0, 5, n),
-        "customer_type": cust_type,
-    })
-    eps = 1e-9
-    df["DTI"] = df["existing_debt"] / (df["income"] + eps)
-    df["LTV"] = df["loan_amount"] / (df["collateral_value"] + eps)
-    df["CCR"] = df["collateral_value"] / (df["loan_amount"] + eps)
-    df["ITI"] = (df["loan_amount"] / (df["loan_duration_months"] + eps)) / (df["income"] + eps)
-    df["CWI"] = ((1 - df["DTI"]).clip(0, 1)) * ((1 - df["LTV"]).clip(0, 1)) * (df["CCR"].clip(0, 3))
-
-    fx = st.session_state["currency_fx"]
-    for c in ("income", "loan_amount", "collateral_value", "assets_owned", "existing_debt"):
-        df[c] = (df[c] * fx).round(2)
-    df["currency_code"] = st.session_state["currency_code"]
-    return dedupe_columns(df)
+_AGENT_SCHEMA_COLS = frozenset({
+    "employment_years", "debt_to_income", "credit_history_length",
+    "num_delinquencies", "requested_amount", "loan_term_months",
+})
 
 def to_agent_schema(df: pd.DataFrame) -> pd.DataFrame:
     """
     Harmonize to the server-side agent’s expected schema.
     """
-    out = df.copy()
+    if _AGENT_SCHEMA_COLS.issubset(df.columns):
+        return dedupe_columns(df)
+    # only missing columns are added below, so the caller's data can be shared
+    out = df.copy(deep=False)
     n = len(out)
     if "employment_years" not in out.columns:
         out["employment_years"] = out.get("employment_length", 0)
@@ -1106,6 +1301,21 @@ def to_agent_schema(df: pd.DataFrame) -> pd.DataFrame:
         out["loan_term_months"] = out.get("loan_duration_months", 0)
     return dedupe_columns(out)
 
+@st.cache_data(max_entries=8, show_spinner=False)
+def _agent_csv_bytes(source_key: str, _df: pd.DataFrame) -> bytes:
+    """Sanitized, agent-schema CSV payload; repeat runs on the same dataset skip the whole pipeline.
+
+    Cached on source_key (upload file_id / bytes hash / generation token) only: cache_data
+    hashes large frames from a row sample, which can't tell two big uploads apart.
+    """
+    safe = dedupe_columns(_df)
+    safe, _ = drop_pii_columns(safe)
+    safe = strip_policy_banned(safe)
+    safe = to_agent_schema(safe)
+    buf = io.BytesIO()
+    safe.to_csv(buf, index=False)
+    return buf.getvalue()
+
 # ─────────────────────────────────────────────
 # 🏦 TAB 1 — Synthetic Data Generator
 with tab_gen:
@@ -1132,29 +1342,35 @@ with tab_gen:
     colA, colB = st.columns(2)
     with colA:
         if st.button("🔴 Generate RAW Synthetic Data (with PII)", use_container_width=True):
-            raw_df = append_user_info(generate_raw_synthetic(rows, non_bank_ratio))
+            raw_df = append_user_info(generate_raw_synthetic(
+                rows, non_bank_ratio, st.session_state["currency_code"]
+            ))
             st.session_state.synthetic_raw_df = raw_df
+            st.session_state["synthetic_raw_key"] = uuid.uuid4().hex
             raw_path = save_to_runs(raw_df, "synthetic_raw")
             st.success(f"Generated RAW (PII) dataset with {rows} rows in {st.session_state['currency_label']}. Saved to {raw_path}")
             st.dataframe(raw_df.head(10), use_container_width=True)
             st.download_button(
                 "⬇️ Download RAW CSV",
-                raw_df.to_csv(index=False).encode("utf-8"),
-                os.path.basename(raw_path),
+                _df_to_csv_bytes(raw_df),
+                os.path.splitext(os.path.basename(raw_path))[0] + ".csv",
                 "text/csv"
             )
 
     with colB:
         if st.button("🟢 Generate ANON Synthetic Data (ready for agent)", use_container_width=True):
-            anon_df = append_user_info(generate_anon_synthetic(rows, non_bank_ratio))
+            anon_df = append_user_info(generate_anon_synthetic(
+                rows, non_bank_ratio, st.session_state["currency_code"]
+            ))
             st.session_state.synthetic_df = anon_df
+            st.session_state["synthetic_key"] = uuid.uuid4().hex
             anon_path = save_to_runs(anon_df, "synthetic_anon")
             st.success(f"Generated ANON dataset with {rows} rows in {st.session_state['currency_label']}. Saved to {anon_path}")
             st.dataframe(anon_df.head(10), use_container_width=True)
             st.download_button(
                 "⬇️ Download ANON CSV",
-                anon_df.to_csv(index=False).encode("utf-8"),
-                os.path.basename(anon_path),
+                _df_to_csv_bytes(anon_df),
+                os.path.splitext(os.path.basename(anon_path))[0] + ".csv",
                 "text/csv"
             )
 
@@ -1166,30 +1382,43 @@ with tab_clean:
 
     uploaded = st.file_uploader("Upload CSV file", type=["csv"])
     if uploaded:
-        try:
-            df = pd.read_csv(uploaded)
-        except Exception as e:
-            st.error(f"Could not read CSV: {e}")
-            st.stop()
-
-        st.write("📊 Original Data Preview:")
-        st.dataframe(dedupe_columns(df.head(5)), use_container_width=True)
-
-        sanitized, dropped_cols = drop_pii_columns(df)
-        sanitized = append_user_info(sanitized)
-        sanitized = dedupe_columns(sanitized)
-        st.session_state.anonymized_df = sanitized
-
-        st.success(f"Dropped PII columns: {sorted(dropped_cols) if dropped_cols else 'None'}")
-        st.write("✅ Sanitized Data Preview:")
-        st.dataframe(sanitized.head(5), use_container_width=True)
+        # Sanitize (and persist) once per upload; other widget reruns reuse the result.
+        # file_id is new for every upload, so an edited file of the same name/size is re-read.
+        src = uploaded.file_id
+        if st.session_state.get("clean_src") != src:
+            try:
+                df = _parse_csv(uploaded.getvalue())
+            except Exception as e:
+                st.error(f"Could not read CSV: {e}")
+                st.stop()
+
+            sanitized, dropped_cols = drop_pii_columns(df)
+            sanitized = append_user_info(sanitized)
+            sanitized = dedupe_columns(sanitized)
+            st.session_state.anonymized_df = sanitized
+            st.session_state["clean_result"] = {
+                "preview": dedupe_columns(df.head(5)),
+                "dropped": sorted(dropped_cols),
+                "path": save_to_runs(sanitized, "anonymized"),
+            }
+            st.session_state["clean_src"] = src
+        clean = st.session_state["clean_result"]
+        sanitized = st.session_state.anonymized_df
+        fpath = clean["path"]
+
+        st.success(f"Dropped PII columns: {clean['dropped'] or 'None'}")
+        # Previews are opt-in: a collapsed expander still ships its tables on every rerun.
+        if st.checkbox("Show original / sanitized previews", value=False, key="clean_show_previews"):
+            st.write("📊 Original Data Preview:")
+            st.dataframe(clean["preview"], use_container_width=True)
+            st.write("✅ Sanitized Data Preview:")
+            st.dataframe(sanitized.head(5), use_container_width=True)
 
-        fpath = save_to_runs(sanitized, "anonymized")
         st.success(f"Saved anonymized file: {fpath}")
         st.download_button(
             "⬇️ Download Clean Data",
-            sanitized.to_csv(index=False).encode("utf-8"),
-            os.path.basename(fpath),
+            _df_to_csv_bytes(sanitized),
+            os.path.splitext(os.path.basename(fpath))[0] + ".csv",
             "text/csv"
         )
     else:
@@ -1237,7 +1466,7 @@ with tab_run:
                     st.warning("Select a CSV file first.")
                 else:
                     try:
-                        resp = requests.post(
+                        resp = get_http().post(
                             f"{API_URL}/v1/asset-bridge/upload",
                             files={"file": (upload_file.name, upload_file.getvalue(), "text/csv")},
                             timeout=30,
@@ -1256,7 +1485,7 @@ with tab_run:
                     try:
                         with open(ASSET_SAMPLE_PATH, "rb") as f:
                             sample_bytes = f.read()
-                        resp = requests.post(
+                        resp = get_http().post(
                             f"{API_URL}/v1/asset-bridge/upload",
                             files={"file": ("sample_asset_appraisals.csv", sample_bytes, "text/csv")},
                             timeout=30,
@@ -1280,8 +1509,7 @@ with tab_run:
             icon="🔗",
         )
         preview_records = st.session_state.get("asset_bridge_preview") or []
-        if preview_records:
-            st.caption("Preview of uploaded collateral dataset (first 10 rows).")
+        if preview_records and st.checkbox("Show collateral preview (first 10 rows)", value=False, key="asset_bridge_show_preview"):
             st.dataframe(pd.DataFrame(preview_records), use_container_width=True)
     else:
         st.caption(
@@ -1290,9 +1518,8 @@ with tab_run:
 
     # Production model banner (optional)
     try:
-        resp = requests.get(f"{API_URL}/v1/training/production_meta", timeout=5)
-        if resp.status_code == 200:
-            meta = resp.json()
+        meta = fetch_production_meta()
+        if meta is not None:
             if meta.get("has_production"):
                 ver = (meta.get("meta") or {}).get("version", "1.x")
                 src = (meta.get("meta") or {}).get("source", "production")
@@ -1310,17 +1537,9 @@ with tab_run:
     trained_dir = os.path.expanduser(
         "~/credit-appraisal-agent-poc/agents/credit_appraisal/models/trained"
     )
-    models = []
-    if os.path.exists(trained_dir):
-        for f in os.listdir(trained_dir):
-            if f.endswith(".joblib"):
-                fpath = os.path.join(trained_dir, f)
-                ctime = os.path.getctime(fpath)
-                created = datetime.datetime.fromtimestamp(ctime).strftime("%b %d, %Y %H:%M")
-                models.append((f, fpath, created))
+    models = list_trained_models(trained_dir)
 
     if models:
-        models.sort(key=lambda x: x[2], reverse=True)
         display_names = [f"{m[0]} — {m[2]}" for m in models]
 
         selected_display = st.selectbox("📦 Select trained model to use", display_names)
@@ -1337,8 +1556,8 @@ with tab_run:
                     "~/credit-appraisal-agent-poc/agents/credit_appraisal/models/production/model.joblib"
                 )
                 os.makedirs(os.path.dirname(prod_path), exist_ok=True)
-                import shutil
                 shutil.copy2(selected_model, prod_path)
+                fetch_production_meta.clear()
                 st.success(f"✅ Model promoted to production: {os.path.basename(prod_path)}")
             except Exception as e:
                 st.error(f"❌ Promotion failed: {e}")
@@ -1393,9 +1612,12 @@ with tab_run:
     if data_choice == "Upload manually":
         up = st.file_uploader("Upload your CSV", type=["csv"], key="manual_upload_run_file")
         if up is not None:
-            st.session_state["manual_upload_name"] = up.name
-            st.session_state["manual_upload_bytes"] = up.getvalue()
-            st.success(f"File staged: {up.name} ({len(st.session_state['manual_upload_bytes'])} bytes)")
+            # re-stage only on a new upload (file_id changes even for a same-size file); reruns keep the staged bytes
+            if st.session_state.get("manual_upload_key") != up.file_id:
+                st.session_state["manual_upload_name"] = up.name
+                st.session_state["manual_upload_bytes"] = up.getvalue()
+                st.session_state["manual_upload_key"] = up.file_id
+            st.success(f"File staged: {up.name} ({up.size} bytes)")
 
     # 3) Rules
     st.markdown("### ⚙️ Decision Rule Set")
@@ -1541,29 +1763,32 @@ with tab_run:
                     "rule_mode": "ndi",
                 })
 
-            def prep_and_pack(df: pd.DataFrame, filename: str):
-                safe = dedupe_columns(df)
-                safe, _ = drop_pii_columns(safe)
-                safe = strip_policy_banned(safe)
-                safe = to_agent_schema(safe)
-                buf = io.StringIO()
-                safe.to_csv(buf, index=False)
-                return {"file": (filename, buf.getvalue().encode("utf-8"), "text/csv")}
+            def prep_and_pack(df: pd.DataFrame, filename: str, source_key: str):
+                return {"file": (filename, _agent_csv_bytes(source_key, df), "text/csv")}
 
             if data_choice == "Use synthetic (ANON)":
                 if "synthetic_df" not in st.session_state:
                     st.warning("No ANON synthetic dataset found. Generate it in the first tab."); st.stop()
-                files = prep_and_pack(st.session_state.synthetic_df, "synthetic_anon.csv")
+                files = prep_and_pack(
+                    st.session_state.synthetic_df, "synthetic_anon.csv",
+                    f"synthetic_anon:{st.session_state.get('synthetic_key')}",
+                )
 
             elif data_choice == "Use synthetic (RAW – auto-sanitize)":
                 if "synthetic_raw_df" not in st.session_state:
                     st.warning("No RAW synthetic dataset found. Generate it in the first tab."); st.stop()
-                files = prep_and_pack(st.session_state.synthetic_raw_df, "synthetic_raw_sanitized.csv")
+                files = prep_and_pack(
+                    st.session_state.synthetic_raw_df, "synthetic_raw_sanitized.csv",
+                    f"synthetic_raw:{st.session_state.get('synthetic_raw_key')}",
+                )
 
             elif data_choice == "Use anonymized dataset":
                 if "anonymized_df" not in st.session_state:
                     st.warning("No anonymized dataset found. Create it in the second tab."); st.stop()
-                files = prep_and_pack(st.session_state.anonymized_df, "anonymized.csv")
+                files = prep_and_pack(
+                    st.session_state.anonymized_df, "anonymized.csv",
+                    f"anonymized:{st.session_state.get('clean_src')}",
+                )
 
             elif data_choice == "Upload manually":
                 up_name = st.session_state.get("manual_upload_name")
@@ -1571,14 +1796,14 @@ with tab_run:
                 if not up_name or not up_bytes:
                     st.warning("Please upload a CSV first."); st.stop()
                 try:
-                    tmp_df = pd.read_csv(io.BytesIO(up_bytes))
-                    files = prep_and_pack(tmp_df, up_name)
+                    tmp_df = _parse_csv(up_bytes)
+                    files = prep_and_pack(tmp_df, up_name, f"upload:{hashlib.sha256(up_bytes).hexdigest()}")
                 except Exception:
                     files = {"file": (up_name, up_bytes, "text/csv")}
             else:
                 st.error("Unknown data source selection."); st.stop()
 
-            r = requests.post(f"{API_URL}/v1/agents/{agent_name}/run", data=data, files=files, timeout=180)
+            r = get_http().post(f"{API_URL}/v1/agents/{agent_name}/run", data=data, files=files, timeout=180)
             if r.status_code != 200:
                 st.error(f"Run failed ({r.status_code}): {r.text}"); st.stop()
 
@@ -1590,38 +1815,23 @@ with tab_run:
             # Pull merged.csv for dashboards/review
             rid = st.session_state.last_run_id
             merged_url = f"{API_URL}/v1/runs/{rid}/report?format=csv"
-            merged_bytes = requests.get(merged_url, timeout=30).content
+            merged_bytes = get_http().get(merged_url, timeout=30).content
             merged_df = pd.read_csv(io.BytesIO(merged_bytes))
             st.session_state["last_merged_df"] = merged_df
+            st.session_state.pop("review_edits", None)
+            st.session_state.pop("review_page", None)
 
             # # Export AI outputs as csv with currency code (for Human Review dropdown)
             # ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
             # out_name = f"ai-appraisal-outputs-{ts}-{st.session_state['currency_code']}.csv"
             # st.download_button("⬇️ Download AI outputs (CSV)", merged_df.to_csv(index=False).encode("utf-8"), out_name, "text/csv")
 
-            # Decision filter IN TABLE (not hiding dashboard)
-            st.markdown("### 📄 Credit Ai Agent  Decisions Table (filtered)")
-            uniq_dec = sorted([d for d in merged_df.get("decision", pd.Series(dtype=str)).dropna().unique()])
-            chosen = st.multiselect("Filter decision", options=uniq_dec, default=uniq_dec, key="filter_decisions")
-            df_view = merged_df.copy()
-            if "decision" in df_view.columns and chosen:
-                df_view = df_view[df_view["decision"].isin(chosen)]
-            st.dataframe(df_view, use_container_width=True)
-
             # ── DASHBOARD (always visible; filters apply in table below)
             st.markdown("## 📊 Dashboard")
             render_credit_dashboard(merged_df, st.session_state.get("currency_symbol", ""))
 
-            # Per-row metrics met/not met
-            if "rule_reasons" in df_view.columns:
-                rr = df_view["rule_reasons"].apply(try_json)
-                df_view["metrics_met"] = rr.apply(lambda d: ", ".join(sorted([k for k, v in (d or {}).items() if v is True])) if isinstance(d, dict) else "")
-                df_view["metrics_unmet"] = rr.apply(lambda d: ", ".join(sorted([k for k, v in (d or {}).items() if v is False])) if isinstance(d, dict) else "")
-            cols_show = [c for c in [
-                "application_id","customer_type","decision","score","loan_amount","income","metrics_met","metrics_unmet",
-                "proposed_loan_option","proposed_consolidation_loan","top_feature","explanation"
-            ] if c in df_view.columns]
-            st.dataframe(df_view[cols_show].head(500), use_container_width=True)
+            # Decision filter IN TABLE (not hiding dashboard)
+            _decision_table(merged_df)
 
             #  # Export AI outputs as csv with currency code (for Human Review dropdown)
             # ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -1632,28 +1842,10 @@ with tab_run:
                         # Export AI outputs as CSV with currency code (for Human Review dropdown)
             ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
             out_name = f"ai-appraisal-outputs-{ts}-{st.session_state['currency_code']}.csv"
-            csv_data = merged_df.to_csv(index=False).encode("utf-8")
+            csv_data = _df_to_csv_bytes(merged_df)
 
             # Correct CSS selector for Streamlit's download button
-            st.markdown("""
-            <style>
-            div[data-testid="stDownloadButton"] button {
-                font-size: 90px !important;
-                font-weight: 900 !important;
-                padding: 28px 48px !important;
-                border-radius: 16px !important;
-                background: linear-gradient(90deg, #2563eb, #1d4ed8) !important;
-                color: white !important;
-                border: none !important;
-                box-shadow: 0 6px 18px rgba(0,0,0,0.35) !important;
-                transition: all 0.3s ease-in-out !important;
-            }
-            div[data-testid="stDownloadButton"] button:hover {
-                background: linear-gradient(90deg, #1e3a8a, #1d4ed8) !important;
-                transform: scale(1.03);
-            }
-            </style>
-            """, unsafe_allow_html=True)
+            st.markdown(_DOWNLOAD_BTN_CSS, unsafe_allow_html=True)
 
             # Styled large download button
             st.download_button(
@@ -1684,14 +1876,20 @@ with tab_run:
 
 # ─────────────────────────────────────────────
 # 🧑‍⚖️ TAB 4 — Human Review
-with tab_review:
+@_fragment
+def _review_tab():
+    """Review tab body; uploader, editor paging and scoring rerun only this fragment."""
     st.subheader("🧑‍⚖️ Human Review — Correct AI Decisions & Score Agreement > Drop your AI appraisal output CSV from previous Stage  below")
 
     # Allow loading AI output CSV back into review via dropdown upload
     uploaded_review = st.file_uploader("Load AI outputs CSV for review (optional)", type=["csv"], key="review_csv_loader")
-    if uploaded_review is not None:
+    # file_id is new for every upload, so a corrected file of the same name/size is picked up
+    if uploaded_review is not None and st.session_state.get("review_src") != uploaded_review.file_id:
         try:
-            st.session_state["last_merged_df"] = pd.read_csv(uploaded_review)
+            st.session_state["last_merged_df"] = _parse_csv(uploaded_review.getvalue())
+            st.session_state["review_src"] = uploaded_review.file_id
+            st.session_state.pop("review_edits", None)
+            st.session_state.pop("review_page", None)
             st.success("Loaded review dataset from uploaded CSV.")
         except Exception as e:
             st.error(f"Could not read uploaded CSV: {e}")
@@ -1699,7 +1897,7 @@ with tab_review:
     if "last_merged_df" not in st.session_state:
         st.info("Run the agent (previous tab) or upload an AI outputs CSV to load results for review.")
     else:
-        dfm = st.session_state["last_merged_df"].copy()
+        dfm = st.session_state["last_merged_df"]  # read-only here; the editor gets its own column slice
         st.markdown("#### 1) Select rows to review and correct")
 
         editable_cols = []
@@ -1707,21 +1905,44 @@ with tab_review:
         if "rule_reasons" in dfm.columns: editable_cols.append("rule_reasons")
         if "customer_type" in dfm.columns: editable_cols.append("customer_type")
 
-        editable = dfm[["application_id"] + editable_cols].copy()
-        editable.rename(columns={"decision": "ai_decision"}, inplace=True)
-        editable["human_decision"] = editable.get("ai_decision", "approved")
-        editable["human_rule_reasons"] = editable.get("rule_reasons", "")
+        editable = dfm[["application_id"] + editable_cols].rename(columns={"decision": "ai_decision"})
+        editable = editable.assign(
+            human_decision=editable.get("ai_decision", "approved"),
+            human_rule_reasons=editable.get("rule_reasons", ""),
+        )
 
-        edited = st.data_editor(
-            editable,
-            num_rows="dynamic",
+        # Human edits live in session_state keyed by application_id, so only one page
+        # at a time is shipped to the browser and paging never loses corrections.
+        review_edits = st.session_state.setdefault(
+            "review_edits", {"human_decision": {}, "human_rule_reasons": {}}
+        )
+
+        def _apply_review_edits(frame: pd.DataFrame) -> pd.DataFrame:
+            ids = frame["application_id"]
+            return frame.assign(**{
+                col: frame[col].mask(ids.isin(vals.keys()), ids.map(vals))
+                for col, vals in review_edits.items() if vals
+            })
+
+        REVIEW_PAGE_SIZE = 200
+        n_pages = max(1, -(-len(editable) // REVIEW_PAGE_SIZE))
+        page_no = int(st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, step=1, key="review_page"))
+        start = (page_no - 1) * REVIEW_PAGE_SIZE
+        page = _apply_review_edits(editable.iloc[start:start + REVIEW_PAGE_SIZE])
+
+        edited_page = st.data_editor(
+            page,
+            num_rows="fixed",
             use_container_width=True,
-            key="review_editor",
+            key=f"review_editor_{page_no}",
             column_config={
                 "human_decision": st.column_config.SelectboxColumn(options=["approved", "denied"]),
                 "customer_type": st.column_config.SelectboxColumn(options=["bank", "non-bank"], disabled=True)
             }
         )
+        for col, vals in review_edits.items():
+            vals.update(zip(edited_page["application_id"], edited_page[col]))
+        edited = _apply_review_edits(editable)
 
         st.markdown("#### 2) Compute agreement score")
         # if st.button("Compute agreement score"):
@@ -1739,7 +1960,6 @@ with tab_review:
                 st.session_state["last_agreement_score"] = score
 
                 # 🌡️ BEAUTIFUL Gauge
-                import plotly.graph_objects as go
                 fig = go.Figure(go.Indicator(
                     mode="gauge+number",
                     value=score * 100,
@@ -1820,8 +2040,6 @@ with tab_review:
                 if disagree > 0:
                     st.markdown(f"### ❌ {disagree} loans disagreed out of {total} ({(disagree/total)*100:.1f}% disagreement rate)")
 
-                    import json
-
                     def parse_ai_reason(r: str):
                         """Parse AI rule_reasons and summarize which metrics passed or failed."""
                         if not isinstance(r, str):
@@ -1873,10 +2091,13 @@ with tab_review:
         ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
         safe_user = st.session_state["user_info"]["name"].replace(" ", "").lower()
         review_name = f"creditappraisal.{safe_user}.{model_used}.{ts}.csv"
-        csv_bytes = edited.to_csv(index=False).encode("utf-8")
+        csv_bytes = df_to_csv_bytes(edited)  # user-edited: never served from cache
         st.download_button("⬇️ Export review CSV", csv_bytes, review_name, "text/csv")
         st.caption(f"Saved file name pattern: **{review_name}**")
 
+with tab_review:
+    _review_tab()
+
 
 # ─────────────────────────────────────────────
 # 🔁 TAB 5 — Training (Feedback → Retrain)
@@ -1908,30 +2129,61 @@ with tab_train:
 
     colA, colB = st.columns([1,1])
     with colA:
-        if st.button("🚀 Train candidate model"):
+        if st.button("🚀 Train candidate model", disabled="train_future" in st.session_state):
+            st.session_state["train_future"] = get_executor().submit(
+                get_http().post, f"{API_URL}/v1/training/train", json=payload, timeout=90
+            )
+            st.rerun()
+    with colB:
+        if st.button("⬆️ Promote last candidate to PRODUCTION", disabled="promote_future" in st.session_state):
+            st.session_state["promote_future"] = get_executor().submit(
+                get_http().post, f"{API_URL}/v1/training/promote", timeout=30
+            )
+            st.rerun()
+
+    # Background jobs: collect results once finished, otherwise keep the UI responsive.
+    train_fut = st.session_state.get("train_future")
+    if train_fut is not None:
+        if train_fut.done():
+            st.session_state.pop("train_future")
             try:
-                r = requests.post(f"{API_URL}/v1/training/train", json=payload, timeout=90)
+                r = train_fut.result()
                 if r.ok:
                     st.success(r.json())
                     st.session_state["last_train_job"] = r.json().get("job_id")
+                    list_trained_models.clear()
                 else:
                     st.error(r.text)
             except Exception as e:
                 st.error(f"Train failed: {e}")
-    with colB:
-        if st.button("⬆️ Promote last candidate to PRODUCTION"):
+        else:
+            st.info("⏳ Training in progress…")
+            if st.button("🔄 Check training status"):
+                st.rerun()
+
+    promote_fut = st.session_state.get("promote_future")
+    if promote_fut is not None:
+        if promote_fut.done():
+            st.session_state.pop("promote_future")
             try:
-                r = requests.post(f"{API_URL}/v1/training/promote", timeout=30)
+                r = promote_fut.result()
+                fetch_production_meta.clear()
                 st.write(r.json() if r.ok else r.text)
             except Exception as e:
                 st.error(f"Promote failed: {e}")
+        else:
+            st.info("⏳ Promotion in progress…")
+            if st.button("🔄 Check promotion status"):
+                st.rerun()
 
     st.markdown("---")
     st.markdown("#### Production Model")
+    if st.button("🔄 Refresh production meta"):
+        fetch_production_meta.clear()
     try:
-        resp = requests.get(f"{API_URL}/v1/training/production_meta", timeout=5)
-        if resp.ok:
-            st.json(resp.json())
+        meta = fetch_production_meta()
+        if meta is not None:
+            st.json(meta)
         else:
             st.info("No production model yet.")
     except Exception as e:
@@ -161,3 +161,47 @@ def test_api_end_to_end_run_and_downloads(tmp_path):
     ok_file = tmp_path / f"e2e_ok_{run_id}.txt"
     ok_file.write_text(json.dumps({"run_id": run_id, "approved": approved, "denied": denied}, indent=2))
     assert ok_file.exists()
+
+
+@pytest.mark.order(2)
+def test_asset_appraisal_run_batch():
+    _wait_for_api_ready()
+
+    # Same resolution as the agent: ASSET_AGENT_RUNS_ROOT or the repo's services/api/.runs/asset
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runs_root = os.getenv("ASSET_AGENT_RUNS_ROOT") or os.path.join(repo_root, "services", "api", ".runs", "asset")
+    valuations_dir = os.path.join(os.path.expanduser(runs_root), "valuations")
+    before = set(os.listdir(valuations_dir)) if os.path.isdir(valuations_dir) else set()
+
+    asset_types = ["house", "car", "land", "equipment", "house", "apartment"]
+    items = [
+        {"asset_type": a, "metadata": {"city": "HCMC", "ref": f"REF_{i}"}}
+        for i, a in enumerate(asset_types)
+    ]
+    r = requests.post(f"{API_URL}/v1/agents/asset_appraisal/run_batch", json={"items": items}, timeout=60)
+    assert r.status_code == 200, f"Batch failed: {r.status_code} {r.text}"
+    resp = r.json()
+    assert resp.get("status") == "ok"
+    assert resp["count"] == len(items)
+
+    results = resp["results"]
+    assert len(results) == len(items)
+    # Order is kept: each result matches the item at the same position
+    for i, (item, res) in enumerate(zip(items, results)):
+        assert res["asset_type"] == item["asset_type"], f"Result {i} out of order"
+        assert res["asset_id"].endswith(f"_{i:04d}"), f"Unexpected asset_id {res['asset_id']}"
+
+    ids = [res["asset_id"] for res in results]
+    assert len(set(ids)) == len(ids), f"Duplicate asset_ids: {ids}"
+
+    # One valuation file per item
+    new_files = set(os.listdir(valuations_dir)) - before
+    assert new_files == {f"{aid}.json" for aid in ids}, f"Unexpected files: {sorted(new_files)}"
+
+    # Oversized batches are rejected before any file is written
+    schema = requests.get(f"{API_URL}/openapi.json", timeout=10).json()
+    max_items = schema["components"]["schemas"]["AssetBatchRequest"]["properties"]["items"]["maxItems"]
+    too_many = [{"asset_type": "car"}] * (max_items + 1)
+    r = requests.post(f"{API_URL}/v1/agents/asset_appraisal/run_batch", json={"items": too_many}, timeout=60)
+    assert r.status_code == 422, f"Expected 422 for {len(too_many)} items, got {r.status_code}"
+    assert set(os.listdir(valuations_dir)) - before == new_files